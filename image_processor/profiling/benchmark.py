@@ -0,0 +1,335 @@
+"""
+Benchmarking utilities for measuring image processing performance.
+"""
+
+import logging
+import os
+import shutil
+import sys
+import time
+import tracemalloc
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from image_processor.transformations.processor import ImageProcessor
+from image_processor.utils.test_data import generate_test_images
+
+logger = logging.getLogger(__name__)
+
+def _measure_call(proc, func, use_rss=False):
+    """
+    Run a callable and measure wall time, peak memory and CPU time.
+
+    Memory is reported as the tracemalloc peak by default: it is monotone
+    over the measured block and needs no kernel round-trip, where an RSS
+    delta is noisy (GC timing, allocator heuristics). Pass use_rss=True when
+    C-extension allocations outside the Python allocator (e.g. Pillow pixel
+    buffers) must be counted.
+
+    Args:
+        proc: psutil.Process handle for the current process
+        func: Zero-argument callable to benchmark
+        use_rss: Measure an RSS delta instead of the tracemalloc peak
+
+    Returns:
+        Dict with execution_time (s), memory_mb and cpu_seconds
+    """
+    if use_rss:
+        initial_memory = proc.memory_info().rss
+    else:
+        tracemalloc.start()
+    initial_user, initial_system = proc.cpu_times()[:2]
+
+    t0 = time.perf_counter_ns()
+    func()
+    execution_time = (time.perf_counter_ns() - t0) * 1e-9
+
+    if use_rss:
+        memory_bytes = proc.memory_info().rss - initial_memory
+    else:
+        _, memory_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    final_user, final_system = proc.cpu_times()[:2]
+
+    return {
+        "execution_time": execution_time,
+        "memory_mb": memory_bytes / (1024 * 1024),
+        "cpu_seconds": (final_user - initial_user) + (final_system - initial_system),
+    }
+
+def _run_iteration(input_dir, output_dir, files, process_params, use_rss=False):
+    """
+    Run one benchmark iteration; module-level so it is picklable for
+    ProcessPoolExecutor workers.
+    """
+    import psutil
+
+    processor = ImageProcessor(input_dir, output_dir)
+    return _measure_call(
+        psutil.Process(),
+        lambda: processor.process_images(files=files, **process_params),
+        use_rss=use_rss,
+    )
+
+class BenchmarkMetrics:
+    """
+    Collect timing, memory and CPU samples for benchmark runs.
+
+    Averages are tracked as running (count, total) pairs so queries are O(1)
+    and memory stays constant per metric regardless of run length. Raw
+    samples are only retained when keep_samples is set (e.g. for chart
+    error bars).
+    """
+
+    def __init__(self, keep_samples=False):
+        self.keep_samples = keep_samples
+        self.samples = {}
+        self._times = {}
+        self._memory = {}
+        self._cpu = {}
+
+    def _add(self, sums, name, value):
+        entry = sums.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += value
+
+    @staticmethod
+    def _avg(sums, name):
+        entry = sums.get(name)
+        return entry[1] / entry[0] if entry else 0.0
+
+    def add_time(self, name, duration):
+        """Record an execution-time sample in seconds."""
+        self._add(self._times, name, duration)
+        if self.keep_samples:
+            self.samples.setdefault(("time", name), []).append(duration)
+
+    def add_memory(self, name, memory_mb):
+        """Record a memory usage sample in megabytes."""
+        self._add(self._memory, name, memory_mb)
+        if self.keep_samples:
+            self.samples.setdefault(("memory", name), []).append(memory_mb)
+
+    def add_cpu(self, name, cpu_seconds):
+        """Record a CPU time sample in seconds."""
+        self._add(self._cpu, name, cpu_seconds)
+        if self.keep_samples:
+            self.samples.setdefault(("cpu", name), []).append(cpu_seconds)
+
+    def get_avg_time(self, name):
+        """Return the average execution time for a benchmark."""
+        return self._avg(self._times, name)
+
+    def get_avg_memory(self, name):
+        """Return the average memory usage for a benchmark."""
+        return self._avg(self._memory, name)
+
+    def get_avg_cpu(self, name):
+        """Return the average CPU time for a benchmark."""
+        return self._avg(self._cpu, name)
+
+class ImageProcessorBenchmark:
+    """
+    Run repeatable image processing benchmarks and chart the results.
+    """
+
+    def __init__(self, output_base_dir="benchmark_results"):
+        """
+        Initialize the benchmark harness.
+
+        Args:
+            output_base_dir: Directory where benchmark working dirs and
+                results are created
+        """
+        self.output_base_dir = output_base_dir
+        # Precomputed "<base><sep>" prefix: per-iteration paths are then a
+        # single f-string concat instead of an os.path.join chain that
+        # re-normalizes separators on every call.
+        self._path_prefix = output_base_dir.rstrip(os.sep) + os.sep
+        self.metrics = BenchmarkMetrics()
+        # Generated input sets keyed by (test_name, num_images, image_size);
+        # iterations repeat the same workload, so inputs are generated once.
+        self._input_cache = {}
+        # psutil.Process handle, created lazily on first measurement so the
+        # psutil import stays deferred.
+        self._proc = None
+        # Directory deletion is pure I/O; it runs on a background worker so
+        # the next iteration's setup overlaps with the previous teardown.
+        self._cleanup_pool = ThreadPoolExecutor(max_workers=1)
+        self._cleanup_futures = []
+        os.makedirs(self.output_base_dir, exist_ok=True)
+
+    def _discard_directory(self, dir_path):
+        """Atomically move a directory aside and delete it in the background."""
+        trashed = f"{dir_path}.trash.{uuid.uuid4().hex}"
+        os.rename(dir_path, trashed)
+        self._cleanup_futures.append(self._cleanup_pool.submit(shutil.rmtree, trashed))
+
+    def _drain_cleanup(self):
+        """Wait for background directory deletions to finish."""
+        for future in self._cleanup_futures:
+            future.result()
+        self._cleanup_futures = []
+
+    def _ensure_input(self, test_name, num_images, image_size):
+        """
+        Generate the input image set for a benchmark, reusing cached sets.
+
+        Test-image generation is the dominant setup cost, so the input
+        directory is generated once per (test_name, num_images, image_size)
+        and reused across iterations.
+
+        Args:
+            test_name: Name of the benchmark run
+            num_images: Number of test images to generate
+            image_size: Size of the generated test images (width, height)
+
+        Returns:
+            Path to the populated input directory
+        """
+        cache_key = (test_name, num_images, image_size)
+        input_dir = self._input_cache.get(cache_key)
+        if input_dir is None:
+            # The configuration is part of the path so runs that reuse a
+            # test_name with a different workload get their own directory
+            # instead of clobbering one another's cached inputs
+            width, height = image_size
+            input_dir = (f"{self._path_prefix}{test_name}{os.sep}"
+                         f"input_{num_images}_{width}x{height}")
+            if os.path.exists(input_dir):
+                self._discard_directory(input_dir)
+            os.makedirs(input_dir)
+            generate_test_images(input_dir, num_images=num_images, size=image_size)
+            self._input_cache[cache_key] = input_dir
+        return input_dir
+
+    def _fresh_output_dir(self, test_name, iteration):
+        """Create an empty per-iteration output directory."""
+        output_dir = f"{self._path_prefix}{test_name}{os.sep}output_{iteration}"
+        if os.path.exists(output_dir):
+            self._discard_directory(output_dir)
+        os.makedirs(output_dir)
+        return output_dir
+
+    def _measure_performance(self, func, use_rss=False):
+        """
+        Run a callable and measure wall time, memory delta and CPU time.
+
+        Args:
+            func: Zero-argument callable to benchmark
+
+        Returns:
+            Dict with execution_time (s), memory_mb and cpu_seconds
+        """
+        if self._proc is None:
+            # psutil is imported lazily so importing the module stays cheap
+            # when only BenchmarkMetrics is used.
+            import psutil
+            self._proc = psutil.Process()
+        return _measure_call(self._proc, func, use_rss=use_rss)
+
+    def run_comparison(self, test_name="default", num_images=5,
+                       image_size=(1920, 1080), iterations=3, use_rss=False,
+                       **process_params):
+        """
+        Benchmark the image processor over several iterations.
+
+        Args:
+            test_name: Name used for working directories and metric keys
+            num_images: Number of test images per iteration
+            image_size: Size of the generated test images
+            iterations: Number of times to repeat the measurement
+            use_rss: Report RSS deltas instead of tracemalloc peaks
+            **process_params: Passed through to ImageProcessor.process_images
+
+        Returns:
+            Dict with per-iteration measurements and aggregate averages
+        """
+        results = {"test_name": test_name, "iterations": []}
+
+        input_dir = self._ensure_input(test_name, num_images, image_size)
+        # The input set is stable across iterations, so walk it once;
+        # DirEntry.is_file reuses the stat from the scandir syscall.
+        with os.scandir(input_dir) as it:
+            files = [entry.name for entry in it if entry.is_file()]
+        output_dirs = [self._fresh_output_dir(test_name, i) for i in range(iterations)]
+
+        if iterations == 1:
+            # A single iteration is measured in-process to avoid pool
+            # startup cost and cross-worker contention skewing the numbers.
+            processor = ImageProcessor(input_dir, output_dirs[0])
+            measurements = [self._measure_performance(
+                lambda: processor.process_images(files=files, **process_params),
+                use_rss=use_rss,
+            )]
+        else:
+            # Iterations are independent (separate output dirs), so run them
+            # concurrently across cores.
+            max_workers = min(iterations, os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_run_iteration, input_dir, output_dir, files,
+                                    process_params, use_rss)
+                    for output_dir in output_dirs
+                ]
+                measurements = [future.result() for future in futures]
+
+        for measurement in measurements:
+            self.metrics.add_time(test_name, measurement["execution_time"])
+            self.metrics.add_memory(test_name, measurement["memory_mb"])
+            self.metrics.add_cpu(test_name, measurement["cpu_seconds"])
+            results["iterations"].append(measurement)
+
+        results["avg_execution_time"] = self.metrics.get_avg_time(test_name)
+        results["avg_memory_mb"] = self.metrics.get_avg_memory(test_name)
+        results["avg_cpu_seconds"] = self.metrics.get_avg_cpu(test_name)
+        self._drain_cleanup()
+        return results
+
+    def generate_charts(self, results, save_path=None):
+        """
+        Chart per-iteration execution time and memory usage.
+
+        Args:
+            results: Results dict from run_comparison
+            save_path: Optional path for the chart image; shown interactively
+                when omitted
+        """
+        # With no save path and no terminal to show a window from (headless
+        # CI), rendering would be pure waste - skip before the matplotlib
+        # import so those runs never pay for the plotting stack at all.
+        if save_path is None and not sys.stdout.isatty():
+            logger.info("No save path and no interactive display; skipping chart generation")
+            return
+
+        # Heavy plotting imports are deferred so benchmark runs that never
+        # chart anything don't pay the matplotlib/numpy import cost. When
+        # saving to a file, force the headless Agg backend before pyplot is
+        # imported so no GUI backend is probed.
+        import matplotlib
+        if save_path:
+            matplotlib.use("Agg", force=True)
+        import matplotlib.pyplot as plt
+        import numpy as np
+
+        iterations = results["iterations"]
+        indices = np.arange(1, len(iterations) + 1)
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
+
+        ax1.bar(indices, [m["execution_time"] for m in iterations])
+        ax1.set_xlabel("Iteration")
+        ax1.set_ylabel("Execution time (s)")
+        ax1.set_title(f"{results['test_name']}: execution time")
+
+        ax2.bar(indices, [m["memory_mb"] for m in iterations])
+        ax2.set_xlabel("Iteration")
+        ax2.set_ylabel("Memory (MB)")
+        ax2.set_title(f"{results['test_name']}: memory usage")
+
+        fig.tight_layout()
+        if save_path:
+            plt.savefig(save_path, dpi=80, bbox_inches="tight")
+            plt.close(fig)
+        else:
+            plt.show()
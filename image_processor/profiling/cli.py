@@ -7,8 +7,6 @@ import json
 import os
 from typing import List, Optional
 
-from .profiler import ImageProcessorProfiler
-
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parse command line arguments for the profiler.
@@ -80,7 +78,12 @@ def main(args: Optional[List[str]] = None) -> int:
         Exit code (0 for success, non-zero for failure)
     """
     parsed_args = parse_args(args)
-    
+
+    # Imported only after argument parsing succeeds: the profiler pulls in
+    # psutil, cProfile and (transitively) the processing stack, so --help
+    # and argument errors stay fast.
+    from .profiler import ImageProcessorProfiler
+
     try:
         # Create profiler
         profiler = ImageProcessorProfiler(
@@ -2,13 +2,32 @@
 Profiling utilities for image processing operations.
 """
 
+import cProfile
+import io
 import json
+import pstats
+import threading
 import time
+from array import array
 from contextlib import contextmanager
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
 import psutil
 import os
 
+from image_processor.transformations.processor import (ImageProcessor,
+                                                       _SUPPORTED_SUFFIXES)
+
+# orjson serializes dict-of-floats payloads several times faster than the
+# stdlib encoder; fall back to json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# cpu_stats in the JSON dump is capped at this size; the full pstats text
+# goes to its own .txt file alongside it
+_MAX_JSON_CPU_STATS = 10_000
+
 class ProcessingProfiler:
     """Profile image processing operations and save results."""
     
@@ -71,4 +90,400 @@ class ProcessingProfiler:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.stop()
\ No newline at end of file
+        self.stop()
+
+class ImageProcessorProfiler:
+    """
+    Profile the image processing pipeline end to end: CPU profile, wall
+    time and memory usage per image, plus saved reports and charts.
+    """
+
+    # Ring buffer capacity for the background RSS sampler; at 50 Hz this
+    # holds well over a minute of samples
+    _RING_SIZE = 4096
+
+    def __init__(self, output_dir: str, sampling_hz: Optional[int] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            output_dir: Directory where profiling results are saved
+            sampling_hz: When set, sample RSS from a background thread at
+                this rate instead of probing /proc around every image
+        """
+        self.output_dir = output_dir
+        self.created_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        # One timestamp per profiler instance: filenames from the same run
+        # sort together and strftime is not re-run on every save
+        self._run_timestamp = time.strftime('%Y%m%d_%H%M%S')
+        self._save_count = 0
+        self._vis_dir_ready = False
+        # Figure/axes pair reused across visualize_results calls; created
+        # lazily on first use
+        self._fig = None
+        self._ax = None
+        self.profile_data: Dict[str, Any] = {}
+        # Directory listings keyed by input_dir, so stress_test's
+        # iterations x param_variations runs enumerate each directory once
+        self._file_list_cache: Dict[str, List[str]] = {}
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # Each memory_info() call reads /proc/self/status (~100us); two per
+        # image dominates on small inputs. The sampler amortizes that into
+        # one probe per tick shared by every image processed in the window.
+        self._sampling_hz = sampling_hz
+        if sampling_hz:
+            self._sample_times = array('q', bytes(8 * self._RING_SIZE))
+            self._sample_rss = array('q', bytes(8 * self._RING_SIZE))
+            self._sample_count = 0
+            self._sampler = threading.Thread(target=self._sample_rss_loop,
+                                             daemon=True)
+            self._sampler.start()
+
+        # Line-level memory_profiler instrumentation adds 10-100x overhead
+        # per image and distorts every timing this class reports, so it is
+        # opt-in only; the default path uses cheap RSS probes.
+        if os.environ.get('DEEP_MEM_PROFILE'):
+            from memory_profiler import profile as memory_profile
+            self._process_single_image = memory_profile(self._process_single_image)
+
+    def _sample_rss_loop(self):
+        """
+        Record timestamped RSS samples into the ring buffer.
+
+        Single writer, tolerant readers: slots are written before the
+        count is advanced, so no lock is needed.
+        """
+        process = psutil.Process()
+        interval = 1.0 / self._sampling_hz
+        while True:
+            slot = self._sample_count % self._RING_SIZE
+            self._sample_times[slot] = time.perf_counter_ns()
+            self._sample_rss[slot] = process.memory_info().rss
+            self._sample_count += 1
+            time.sleep(interval)
+
+    def _rss_window_mb(self, start_ns: int, end_ns: int) -> Optional[Dict[str, float]]:
+        """
+        Extract before/after/peak RSS (MB) from samples inside a time window.
+
+        Returns None when no sample landed in the window (e.g. the image
+        processed faster than one sampler tick).
+        """
+        window = []
+        count = self._sample_count
+        for i in range(min(count, self._RING_SIZE)):
+            slot = (count - 1 - i) % self._RING_SIZE
+            ts = self._sample_times[slot]
+            if ts < start_ns:
+                break
+            if ts <= end_ns:
+                window.append(self._sample_rss[slot])
+        if not window:
+            return None
+        mb = 1024 * 1024
+        # window is collected newest-first
+        return {
+            'memory_before_mb': window[-1] / mb,
+            'memory_after_mb': window[0] / mb,
+            'peak_memory_mb': max(window) / mb,
+        }
+
+    def _process_single_image(self, processor: ImageProcessor, filename: str,
+                              params: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Process one image, recording wall time and RSS around the call.
+
+        With the background sampler enabled, only two timestamps are taken
+        here and memory figures come from the ring buffer afterwards;
+        otherwise RSS is probed directly before and after the call.
+
+        Args:
+            processor: Processor to run the transformation pipeline
+            filename: Name of the image file to process
+            params: Transformation parameters
+
+        Returns:
+            Per-image timing and memory statistics
+        """
+        memory_before = None
+        if not self._sampling_hz:
+            process = psutil.Process()
+            memory_before = process.memory_info().rss / (1024 * 1024)
+
+        start_ns = time.perf_counter_ns()
+        processor._process_single_image(
+            filename,
+            params['resize_dimensions'],
+            params['blur_radius'],
+            params['sharpen_factor'],
+            params['contrast_factor'],
+            params['brightness_factor']
+        )
+        end_ns = time.perf_counter_ns()
+        processing_time = (end_ns - start_ns) / 1e9
+
+        if self._sampling_hz:
+            stats = self._rss_window_mb(start_ns, end_ns)
+            if stats is None:
+                # No sampler tick landed in the window; one direct probe
+                rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+                stats = {'memory_before_mb': rss_mb,
+                         'memory_after_mb': rss_mb,
+                         'peak_memory_mb': rss_mb}
+            stats['processing_time'] = processing_time
+            return stats
+
+        memory_after = process.memory_info().rss / (1024 * 1024)
+        return {
+            'processing_time': processing_time,
+            'memory_before_mb': memory_before,
+            'memory_after_mb': memory_after,
+            'peak_memory_mb': max(memory_before, memory_after),
+        }
+
+    def _list_images(self, input_dir: str) -> List[str]:
+        """
+        List supported image files in a directory, cached per directory.
+
+        os.scandir avoids a second stat per entry (DirEntry caches it) and
+        the suffix tuple keeps the format check to one C-level endswith.
+        """
+        image_files = self._file_list_cache.get(input_dir)
+        if image_files is None:
+            with os.scandir(input_dir) as entries:
+                image_files = [entry.name for entry in entries
+                               if entry.name.lower().endswith(_SUPPORTED_SUFFIXES)
+                               and entry.is_file()]
+            self._file_list_cache[input_dir] = image_files
+        return image_files
+
+    def profile_processing(self, input_dir: str, output_dir: str,
+                           resize_dimensions=(800, 600),
+                           blur_radius: float = 1.0,
+                           sharpen_factor: float = 1.5,
+                           contrast_factor: float = 1.2,
+                           brightness_factor: float = 1.1,
+                           processor: Optional[ImageProcessor] = None,
+                           deep_profile: bool = False) -> Dict[str, Any]:
+        """
+        Profile a full processing run over an input directory.
+
+        Args:
+            input_dir: Directory containing input images
+            output_dir: Directory for processed images
+            resize_dimensions: Target width and height for resizing
+            blur_radius: Radius for Gaussian blur
+            sharpen_factor: Factor for sharpening
+            contrast_factor: Factor for contrast adjustment
+            brightness_factor: Factor for brightness adjustment
+            processor: Optional shared processor instance, letting repeated
+                runs reuse its decoded-image cache
+            deep_profile: Enable cProfile for the run; off by default since
+                its 30-80% overhead distorts the timings being measured
+
+        Returns:
+            Dict with cpu_stats, memory_stats, timing_stats and
+            per_image_stats sections
+        """
+        params = {
+            'resize_dimensions': resize_dimensions,
+            'blur_radius': blur_radius,
+            'sharpen_factor': sharpen_factor,
+            'contrast_factor': contrast_factor,
+            'brightness_factor': brightness_factor,
+        }
+
+        if processor is None:
+            processor = ImageProcessor(input_dir, output_dir)
+        image_files = self._list_images(input_dir)
+
+        per_image_stats = {}
+        # Peak and count are tracked inline so finalization is O(1) rather
+        # than a second full pass over the stats.
+        peak_memory_mb = 0.0
+        image_count = 0
+        profiler = None
+        if deep_profile:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        total_start = time.perf_counter()
+
+        for filename in image_files:
+            stats = self._process_single_image(processor, filename, params)
+            per_image_stats[filename] = stats
+            image_count += 1
+            if stats['peak_memory_mb'] > peak_memory_mb:
+                peak_memory_mb = stats['peak_memory_mb']
+
+        total_time = time.perf_counter() - total_start
+
+        cpu_stats = ''
+        if profiler is not None:
+            profiler.disable()
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats('cumulative').print_stats()
+            cpu_stats = stream.getvalue()
+
+        self.profile_data = {
+            'cpu_stats': cpu_stats,
+            'memory_stats': {
+                'peak_memory_mb': peak_memory_mb,
+            },
+            'timing_stats': {
+                'total_time': total_time,
+                'average_time_per_image': total_time / image_count if image_count else 0.0,
+            },
+            'per_image_stats': per_image_stats,
+        }
+        return self.profile_data
+
+    def stress_test(self, input_dir: str, output_dir: str,
+                    iterations: int = 5,
+                    param_variations: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Repeatedly profile processing across parameter variations.
+
+        Args:
+            input_dir: Directory containing input images
+            output_dir: Directory for processed images
+            iterations: Number of iterations per parameter set
+            param_variations: Optional list of transformation parameter
+                dicts; a default spread is used when omitted
+
+        Returns:
+            List of profiling results, one per (parameter set, iteration)
+        """
+        if param_variations is None:
+            param_variations = [
+                {'resize_dimensions': (800, 600), 'blur_radius': 1.0,
+                 'sharpen_factor': 1.5, 'contrast_factor': 1.2, 'brightness_factor': 1.1},
+                {'resize_dimensions': (1024, 768), 'blur_radius': 2.0,
+                 'sharpen_factor': 2.0, 'contrast_factor': 1.5, 'brightness_factor': 1.3},
+                {'resize_dimensions': (640, 480), 'blur_radius': 0.5,
+                 'sharpen_factor': 1.2, 'contrast_factor': 1.1, 'brightness_factor': 1.0},
+            ]
+
+        # One processor with a shared decoded-image cache across the whole
+        # run: each input is decoded once instead of once per
+        # (parameter set, iteration) pair.
+        processor = ImageProcessor(input_dir, output_dir)
+        processor.set_decoded_cache({})
+
+        all_results = []
+        for params in param_variations:
+            for iteration in range(iterations):
+                results = self.profile_processing(input_dir, output_dir,
+                                                  processor=processor, **params)
+                # Empty input: skip recording N x M identical empty runs
+                if not results['per_image_stats']:
+                    continue
+                results['parameters'] = params
+                results['iteration'] = iteration
+                all_results.append(results)
+        return all_results
+
+    def visualize_results(self, results: Dict[str, Any]):
+        """
+        Generate bar charts of per-image execution time and memory usage.
+
+        Args:
+            results: Profiling results from profile_processing
+        """
+        # Nothing to plot; skip the matplotlib import and figure setup
+        if not results['per_image_stats']:
+            return
+
+        # matplotlib costs hundreds of milliseconds to import, so only
+        # visualization calls pay for it; Agg is forced first to skip GUI
+        # backend probing.
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+
+        vis_dir = os.path.join(self.output_dir, 'visualizations')
+        if not self._vis_dir_ready:
+            os.makedirs(vis_dir, exist_ok=True)
+            self._vis_dir_ready = True
+
+        per_image = results['per_image_stats']
+        names = list(per_image.keys())
+
+        # One figure/axes pair is reused for every chart: each plt.figure
+        # call pays backend and renderer setup (tens of milliseconds) that
+        # stress_test would otherwise repeat N x M times.
+        if self._fig is None:
+            self._fig, self._ax = plt.subplots(figsize=(12, 6))
+
+        charts = [
+            ('execution_times.png', 'processing_time',
+             'Processing time (s)', 'Per-image execution time'),
+            ('memory_usage.png', 'peak_memory_mb',
+             'Peak memory (MB)', 'Per-image memory usage'),
+        ]
+        for filename, key, ylabel, title in charts:
+            self._ax.clear()
+            self._ax.bar(names, [stat[key] for stat in per_image.values()])
+            self._ax.set_xlabel('Image')
+            self._ax.set_ylabel(ylabel)
+            self._ax.set_title(title)
+            self._ax.tick_params(axis='x', rotation=45)
+            self._fig.tight_layout()
+            self._fig.savefig(os.path.join(vis_dir, filename))
+
+    def save_results(self, results: Dict[str, Any]):
+        """
+        Save profiling results, the CPU profile and an analysis report.
+
+        Args:
+            results: Profiling results from profile_processing
+        """
+        if not results['per_image_stats']:
+            return
+
+        # Run timestamp plus a counter keeps repeated saves (one per
+        # stress_test iteration) distinct without re-reading the clock
+        timestamp = f"{self._run_timestamp}_{self._save_count:03d}"
+        self._save_count += 1
+
+        payload = results
+        if len(results.get('cpu_stats', '')) > _MAX_JSON_CPU_STATS:
+            payload = dict(results,
+                           cpu_stats=results['cpu_stats'][:_MAX_JSON_CPU_STATS])
+
+        data_path = os.path.join(self.output_dir, f'profile_data_{timestamp}.json')
+        if orjson is not None:
+            with open(data_path, 'wb') as f:
+                f.write(orjson.dumps(
+                    payload,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(data_path, 'w') as f:
+                json.dump(payload, f, indent=2)
+
+        cpu_path = os.path.join(self.output_dir, f'cpu_profile_{timestamp}.txt')
+        with open(cpu_path, 'w') as f:
+            f.write(results['cpu_stats'])
+
+        report_path = os.path.join(self.output_dir, f'analysis_report_{timestamp}.txt')
+        with open(report_path, 'w') as f:
+            f.write(self._generate_analysis_report(results))
+
+    def _generate_analysis_report(self, results: Dict[str, Any]) -> str:
+        """Build a human-readable summary of one profiling run."""
+        timing = results['timing_stats']
+        memory = results['memory_stats']
+        lines = [
+            "Image Processing Profile Report",
+            "=" * 40,
+            f"Profiler created: {self.created_at}",
+            "",
+            f"Total time: {timing['total_time']:.3f} s",
+            f"Average time per image: {timing['average_time_per_image']:.3f} s",
+            f"Peak memory: {memory['peak_memory_mb']:.1f} MB",
+            f"Images processed: {len(results['per_image_stats'])}",
+            "",
+            "Top functions by cumulative time:",
+            results['cpu_stats'][:1000],
+        ]
+        return "\n".join(lines)
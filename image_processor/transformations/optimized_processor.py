@@ -0,0 +1,320 @@
+"""
+Optimized image processing with parallel execution across files.
+"""
+
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter
+from typing import List, Tuple, Optional
+
+from .processor import _SUPPORTED_SUFFIXES, _reduce_for_resize
+
+logger = logging.getLogger(__name__)
+
+def _gaussian_kernel1d(sigma: float) -> np.ndarray:
+    """Normalized 1D Gaussian kernel truncated at three sigma."""
+    radius = max(1, int(3.0 * sigma + 0.5))
+    x = np.arange(-radius, radius + 1, dtype=np.float32)
+    kernel = np.exp(-0.5 * (x / sigma) ** 2)
+    return kernel / kernel.sum()
+
+def _gaussian_blur_batch(arr: np.ndarray, sigma: float) -> np.ndarray:
+    """
+    Separable Gaussian blur over the height and width axes of a
+    (K, H, W, C) batch.
+
+    A separable Gaussian is two 1D passes, O(k) per pixel per axis instead
+    of O(k^2) for the full 2D convolution, and each pass is a handful of
+    vectorized shift-multiply-adds across the whole batch at once.
+    """
+    kernel = _gaussian_kernel1d(sigma)
+    radius = len(kernel) // 2
+    for axis in (1, 2):
+        pad = [(0, 0)] * arr.ndim
+        pad[axis] = (radius, radius)
+        padded = np.pad(arr, pad, mode='reflect')
+        out = np.zeros_like(arr)
+        index = [slice(None)] * arr.ndim
+        for offset, weight in enumerate(kernel):
+            index[axis] = slice(offset, offset + arr.shape[axis])
+            out += weight * padded[tuple(index)]
+        arr = out
+    return arr
+
+def _box_blur3_batch(arr: np.ndarray) -> np.ndarray:
+    """3x3 box blur over the height and width axes of a (K, H, W, C) batch."""
+    padded = np.pad(arr, [(0, 0), (1, 1), (1, 1), (0, 0)], mode='edge')
+    out = np.zeros_like(arr)
+    for dy in range(3):
+        for dx in range(3):
+            out += padded[:, dy:dy + arr.shape[1], dx:dx + arr.shape[2]]
+    out /= 9.0
+    return out
+
+def _fused_enhance_batch(arr: np.ndarray,
+                         sharpen_factor: float,
+                         contrast_factor: float,
+                         brightness_factor: float) -> np.ndarray:
+    """
+    Sharpen, contrast and brightness fused into one pass over a batch.
+
+    Same affine fusion as the single-image kernel in processor.py: contrast
+    (pivot 128) and brightness collapse into a scale and offset applied on
+    top of an unsharp mask, touching the batch buffer once.
+    """
+    scale = contrast_factor * brightness_factor
+    offset = (128.0 - 128.0 * contrast_factor) * brightness_factor
+    sharp = arr + (sharpen_factor - 1.0) * (arr - _box_blur3_batch(arr))
+    return np.clip(scale * sharp + offset, 0.0, 255.0).astype(np.uint8)
+
+_EXT_FORMAT = {
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.png': 'PNG',
+    '.bmp': 'BMP',
+    '.tiff': 'TIFF',
+}
+
+def _get_image_format(filename: str) -> str:
+    """Derive the Pillow format name from a filename's extension."""
+    return _EXT_FORMAT.get(os.path.splitext(filename)[1].lower(), 'JPEG')
+
+def _encode_kwargs(image_format: str, quality: int, compress_level: int) -> dict:
+    """
+    Encoder settings favouring speed over the last few percent of size.
+
+    JPEG optimize=True runs a second pass to build optimal Huffman tables,
+    typically 30-60% slower for modest size gains; baseline (non-
+    progressive) encoding with 4:2:0 subsampling is the fast path. PNG
+    compress_level=1 picks zlib's fastest strategy over the default 6.
+    """
+    if image_format == 'JPEG':
+        return {'quality': quality, 'progressive': False, 'subsampling': 2}
+    if image_format == 'PNG':
+        return {'compress_level': compress_level}
+    return {}
+
+class OptimizedImageProcessor:
+    """
+    Process images with a single decode/encode per file, fanned out across
+    worker processes.
+
+    The per-file pipeline executes Python bytecode between Pillow's C calls,
+    so threads serialize on the GIL; processes scale with cores for this
+    embarrassingly parallel workload.
+    """
+
+    def __init__(self, input_dir: str, output_dir: str, max_workers: Optional[int] = None):
+        """
+        Initialize the OptimizedImageProcessor.
+
+        Args:
+            input_dir (str): Directory containing input images
+            output_dir (str): Directory for processed images
+            max_workers (int): Number of worker processes; defaults to the
+                CPU count
+        """
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self._setup_output_directory()
+
+    def _setup_output_directory(self):
+        """Create output directory if it doesn't exist."""
+        if not os.path.exists(self.output_dir):
+            os.makedirs(self.output_dir)
+            logger.info("Created output directory: %s", self.output_dir)
+
+    def process_images(self,
+                       resize_dimensions: Optional[Tuple[int, int]] = (800, 600),
+                       blur_radius: float = 1.0,
+                       sharpen_factor: float = 1.5,
+                       contrast_factor: float = 1.2,
+                       brightness_factor: float = 1.1,
+                       output_format: Optional[str] = None,
+                       files: Optional[List[str]] = None,
+                       quality: int = 90,
+                       compress_level: int = 1):
+        """
+        Process all images in the input directory in parallel.
+
+        Args:
+            resize_dimensions: Target width and height for resizing
+            blur_radius: Radius for Gaussian blur
+            sharpen_factor: Factor for sharpening
+            contrast_factor: Factor for contrast adjustment
+            brightness_factor: Factor for brightness adjustment
+            output_format: Optional output format (e.g. "JPEG", "PNG")
+            files: Optional precomputed list of filenames to process
+            quality: JPEG quality (size vs. speed trade-off)
+            compress_level: PNG zlib compression level
+
+        Returns:
+            Dict with processed_count and error_count
+        """
+        if files is None:
+            # Generator: no full-listing allocation, and the first submit
+            # happens before the directory scan completes on huge input dirs.
+            files = (entry.name for entry in os.scandir(self.input_dir)
+                     if entry.is_file())
+        image_files = (filename for filename in files
+                       if filename.lower().endswith(_SUPPORTED_SUFFIXES))
+
+        workers = self.max_workers or os.cpu_count() or 1
+        task = partial(
+            self._process_single_image,
+            self.input_dir,
+            self.output_dir,
+            resize_dimensions=resize_dimensions,
+            blur_radius=blur_radius,
+            sharpen_factor=sharpen_factor,
+            contrast_factor=contrast_factor,
+            brightness_factor=brightness_factor,
+            output_format=output_format,
+            quality=quality,
+            compress_level=compress_level,
+        )
+
+        # executor.map consumes the generator lazily; a fixed chunksize
+        # amortizes per-task IPC without needing the file count up front
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(task, image_files, chunksize=32))
+
+        processed = sum(1 for ok in results if ok)
+        return {"processed_count": processed, "error_count": len(results) - processed}
+
+    def process_batch(self,
+                      filenames: List[str],
+                      resize_dimensions: Tuple[int, int] = (800, 600),
+                      blur_radius: float = 1.0,
+                      sharpen_factor: float = 1.5,
+                      contrast_factor: float = 1.2,
+                      brightness_factor: float = 1.1,
+                      output_format: Optional[str] = None,
+                      quality: int = 90,
+                      compress_level: int = 1) -> int:
+        """
+        Process a batch of images with all compute vectorized across the
+        batch dimension.
+
+        Decoded images are resized to a common shape and stacked into one
+        (K, H, W, 3) float32 array, so the Gaussian blur and the fused
+        enhance kernel each run once over the whole batch instead of once
+        per image. Saving stays per-file. Suited to profiling workflows
+        where many same-size images share identical parameters.
+
+        Args:
+            filenames: Image filenames within the input directory
+            resize_dimensions: Target width and height for resizing
+            blur_radius: Sigma for the separable Gaussian blur
+            sharpen_factor: Factor for sharpening
+            contrast_factor: Factor for contrast adjustment
+            brightness_factor: Factor for brightness adjustment
+            output_format: Optional output format (e.g. "JPEG", "PNG")
+            quality: JPEG quality (size vs. speed trade-off)
+            compress_level: PNG zlib compression level
+
+        Returns:
+            Number of images successfully processed
+        """
+        decoded = []
+        names = []
+        for filename in filenames:
+            try:
+                with Image.open(os.path.join(self.input_dir, filename)) as image:
+                    if image.format == 'JPEG':
+                        image.draft('RGB', (resize_dimensions[0] * 2, resize_dimensions[1] * 2))
+                    image.load()
+                if image.mode != 'RGB':
+                    image = image.convert('RGB')
+                image = _reduce_for_resize(image, resize_dimensions)
+                image = image.resize(resize_dimensions, Image.LANCZOS)
+                decoded.append(np.asarray(image, dtype=np.float32))
+                names.append(filename)
+            except Exception as e:
+                logger.error("Error decoding %s: %s", filename, e)
+
+        if not decoded:
+            return 0
+
+        batch = np.stack(decoded)
+        if blur_radius > 0:
+            batch = _gaussian_blur_batch(batch, blur_radius)
+        batch = _fused_enhance_batch(batch, sharpen_factor, contrast_factor,
+                                     brightness_factor)
+
+        processed = 0
+        for i, filename in enumerate(names):
+            try:
+                output_path = os.path.join(self.output_dir, f"processed_{filename}")
+                image_format = output_format or _get_image_format(filename)
+                with open(output_path, 'wb', buffering=1 << 20) as fp:
+                    Image.fromarray(batch[i]).save(
+                        fp, format=image_format,
+                        **_encode_kwargs(image_format, quality, compress_level))
+                processed += 1
+            except Exception as e:
+                logger.error("Error saving %s: %s", filename, e)
+        return processed
+
+    @staticmethod
+    def _process_single_image(input_dir: str,
+                              output_dir: str,
+                              filename: str,
+                              resize_dimensions: Tuple[int, int] = (800, 600),
+                              blur_radius: float = 1.0,
+                              sharpen_factor: float = 1.5,
+                              contrast_factor: float = 1.2,
+                              brightness_factor: float = 1.1,
+                              output_format: Optional[str] = None,
+                              quality: int = 90,
+                              compress_level: int = 1) -> bool:
+        """
+        Apply all transformations to one image; staticmethod so it is
+        picklable for ProcessPoolExecutor workers.
+
+        Returns:
+            True if processing succeeded, False otherwise
+        """
+        try:
+            input_path = os.path.join(input_dir, filename)
+            output_path = os.path.join(output_dir, f"processed_{filename}")
+            image_format = output_format or _get_image_format(filename)
+
+            logger.info("Processing image: %s", filename)
+
+            # The with-block closes the file descriptor deterministically;
+            # load() materializes the pixels first so the image stays
+            # usable afterwards.
+            with Image.open(input_path) as image:
+                # For JPEG inputs, draft lets libjpeg skip high-frequency
+                # DCT coefficients and decode at the nearest 1/2, 1/4 or
+                # 1/8 scale; targeting 2x the final size leaves LANCZOS
+                # enough detail.
+                if image.format == 'JPEG':
+                    image.draft('RGB', (resize_dimensions[0] * 2, resize_dimensions[1] * 2))
+                image.load()
+            # Convert palette/alpha modes to RGB once up front; otherwise
+            # every enhance stage repeats a hidden per-pixel mode conversion.
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            image = _reduce_for_resize(image, resize_dimensions)
+            image = image.resize(resize_dimensions, Image.LANCZOS)
+            image = image.filter(ImageFilter.GaussianBlur(blur_radius))
+            image = ImageEnhance.Sharpness(image).enhance(sharpen_factor)
+            image = ImageEnhance.Contrast(image).enhance(contrast_factor)
+            image = ImageEnhance.Brightness(image).enhance(brightness_factor)
+            # A 1 MiB buffer amortizes write syscalls on slow filesystems
+            with open(output_path, 'wb', buffering=1 << 20) as fp:
+                image.save(fp, format=image_format,
+                           **_encode_kwargs(image_format, quality, compress_level))
+
+            logger.info("Successfully processed: %s", filename)
+            return True
+
+        except Exception as e:
+            logger.error("Error processing %s: %s", filename, e)
+            return False
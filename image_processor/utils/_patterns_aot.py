@@ -0,0 +1,56 @@
+"""
+Ahead-of-time compiled fill kernels for the synthetic test patterns.
+
+Running this module (``python -m image_processor.utils._patterns_aot`` or
+the ``build_aot`` step in setup.py) compiles the kernels below into a
+``_patterns_native`` extension module next to this file. test_data imports
+that module first: a short-running call like generate_test_images then
+pays no JIT warm-up and loads no LLVM at all, relying on the
+auto-vectorization LLVM already did at build time.
+
+pycc cannot compile prange-parallel kernels, so these are the plain-loop
+variants of the JIT kernels in _patterns_numba, which remains the
+fallback when no prebuilt extension is present.
+"""
+
+from numba.pycc import CC
+
+cc = CC('_patterns_native')
+
+@cc.export('fill_gradient', 'void(u1[:, :, ::1])')
+def fill_gradient(out):
+    """Horizontal 0..255 gradient across the buffer width."""
+    height, width = out.shape[0], out.shape[1]
+    for y in range(height):
+        for x in range(width):
+            v = x * 255 // (width - 1) if width > 1 else 0
+            out[y, x, 0] = v
+            out[y, x, 1] = v
+            out[y, x, 2] = v
+
+@cc.export('fill_checkerboard', 'void(u1[:, :, ::1], i8)')
+def fill_checkerboard(out, box):
+    """Alternating black/white cells of box x box pixels."""
+    height, width = out.shape[0], out.shape[1]
+    for y in range(height):
+        for x in range(width):
+            v = 0 if (x // box + y // box) % 2 == 0 else 255
+            out[y, x, 0] = v
+            out[y, x, 1] = v
+            out[y, x, 2] = v
+
+@cc.export('fill_lines', 'void(u1[:, :, ::1], i8)')
+def fill_lines(out, spacing):
+    """Black diagonal lines two pixels wide on white, every spacing pixels."""
+    height, width = out.shape[0], out.shape[1]
+    for y in range(height):
+        for x in range(width):
+            v = 0 if (x - y) % spacing < 2 else 255
+            out[y, x, 0] = v
+            out[y, x, 1] = v
+            out[y, x, 2] = v
+
+if __name__ == '__main__':
+    import os
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.compile()
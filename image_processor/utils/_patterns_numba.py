@@ -0,0 +1,49 @@
+"""
+Numba-compiled fill kernels for the synthetic test patterns.
+
+Optional accelerator for test_data._create_pattern: the kernels write into
+a caller-supplied (H, W, 3) uint8 buffer with the outer row loop
+parallelized via prange, which releases the GIL and lets LLVM vectorize
+the inner loop. Eager explicit signatures plus cache=True move compilation
+to install/first-run time instead of every interpreter start.
+
+This module imports numba at import time; test_data catches the
+ImportError and falls back to its NumPy branches.
+"""
+
+from numba import njit, prange
+
+_SIG = 'void(uint8[:, :, ::1], int64)'
+
+@njit('void(uint8[:, :, ::1])', parallel=True, cache=True, fastmath=True)
+def fill_gradient(out):
+    """Horizontal 0..255 gradient across the buffer width."""
+    height, width = out.shape[0], out.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            v = x * 255 // (width - 1) if width > 1 else 0
+            out[y, x, 0] = v
+            out[y, x, 1] = v
+            out[y, x, 2] = v
+
+@njit(_SIG, parallel=True, cache=True, fastmath=True)
+def fill_checkerboard(out, box):
+    """Alternating black/white cells of box x box pixels."""
+    height, width = out.shape[0], out.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            v = 0 if (x // box + y // box) % 2 == 0 else 255
+            out[y, x, 0] = v
+            out[y, x, 1] = v
+            out[y, x, 2] = v
+
+@njit(_SIG, parallel=True, cache=True, fastmath=True)
+def fill_lines(out, spacing):
+    """Black diagonal lines two pixels wide on white, every spacing pixels."""
+    height, width = out.shape[0], out.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            v = 0 if (x - y) % spacing < 2 else 255
+            out[y, x, 0] = v
+            out[y, x, 1] = v
+            out[y, x, 2] = v
@@ -2,13 +2,44 @@
 Utility functions for generating test images.
 """
 
+import functools
 import os
 import logging
-from PIL import Image, ImageDraw
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PIL import Image
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=4)
+def _grid(height, width):
+    """
+    Coordinate grid memoized on size.
+
+    np.indices allocates ~16 MB of int64 at 1920x1080 and every masked
+    pattern needs the same grid, so it is computed once per size instead
+    of once per image.
+    """
+    return np.indices((height, width))
+
+# Module-level PCG64 generator: roughly twice as fast as the legacy
+# Mersenne-Twister behind np.random.randint
+_rng = np.random.default_rng()
+
+# Optional LLVM-compiled fill kernels. Preferred is the AOT-built
+# _patterns_native extension (see _patterns_aot.py): no JIT warm-up, no
+# LLVM in the process. Next is the JIT module, which pays one cached
+# compilation. numba is not a hard dependency; the NumPy branches below
+# are the fallback.
+try:
+    from . import _patterns_native as _patterns
+except ImportError:
+    try:
+        from . import _patterns_numba as _patterns
+    except ImportError:
+        _patterns = None
+
 def generate_test_images(output_dir: str, num_images: int = 5, size: tuple = (1920, 1080)):
     """
     Generate test images with various patterns for processing.
@@ -20,7 +51,7 @@ def generate_test_images(output_dir: str, num_images: int = 5, size: tuple = (19
     """
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
-        logger.info(f"Created directory for test images: {output_dir}")
+        logger.info("Created directory for test images: %s", output_dir)
 
     patterns = [
         "gradient",
@@ -30,61 +61,107 @@ def generate_test_images(output_dir: str, num_images: int = 5, size: tuple = (19
         "lines"
     ]
 
-    for i in range(num_images):
+    # One (H, W, 3) uint8 buffer per worker thread, reused for every
+    # pattern that thread generates: ~6 MB of allocator churn and
+    # first-touch page faults saved per image at the default size.
+    # Thread-local because the pool workers fill buffers concurrently.
+    local = threading.local()
+    width, height = size
+
+    def _make_one(i: int) -> str:
+        buf = getattr(local, 'buf', None)
+        if buf is None:
+            buf = local.buf = np.empty((height, width, 3), dtype=np.uint8)
         pattern = patterns[i % len(patterns)]
-        image = _create_pattern(pattern, size)
+        image = _create_pattern(pattern, size, buf)
         filename = f"test_image_{i+1}_{pattern}.png"
         filepath = os.path.join(output_dir, filename)
-        image.save(filepath, "PNG")
-        logger.info(f"Generated test image: {filename}")
+        # Fixtures are regenerated each run, so encode speed matters and
+        # compression ratio does not: zlib level 1 is ~4x faster than the
+        # default 6 for ~20% larger files
+        image.save(filepath, "PNG", optimize=False, compress_level=1)
+        return filename
+
+    # PNG encoding releases the GIL inside Pillow's zip encoder, so
+    # threads overlap the zlib compression across cores without the
+    # pickling cost of a process pool.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_make_one, i) for i in range(num_images)]
+        for future in as_completed(futures):
+            logger.info("Generated test image: %s", future.result())
 
-def _create_pattern(pattern: str, size: tuple) -> Image.Image:
+def _create_pattern(pattern: str, size: tuple,
+                    buf: np.ndarray = None) -> Image.Image:
     """
     Create an image with the specified pattern.
     
     Args:
         pattern (str): Type of pattern to generate
         size (tuple): Image dimensions (width, height)
+        buf: Optional preallocated (height, width, 3) uint8 buffer the
+            array-based patterns fill in place
     
     Returns:
         Image: Generated test image
     """
     width, height = size
-    image = Image.new('RGB', (width, height), 'white')
-    draw = ImageDraw.Draw(image)
+    if buf is None:
+        buf = np.empty((height, width, 3), dtype=np.uint8)
+
+    if _patterns is not None and pattern in ("gradient", "checkerboard", "lines"):
+        if pattern == "gradient":
+            _patterns.fill_gradient(buf)
+        elif pattern == "checkerboard":
+            _patterns.fill_checkerboard(buf, 100)
+        else:
+            _patterns.fill_lines(buf, 50)
+        return Image.fromarray(buf, 'RGB')
 
     if pattern == "gradient":
-        # Create a horizontal gradient
-        for x in range(width):
-            color = int((x / width) * 255)
-            draw.line([(x, 0), (x, height)], fill=(color, color, color))
+        # Horizontal gradient as one C-level broadcast assignment into
+        # the shared buffer instead of a draw.line call per column
+        col = np.linspace(0, 255, width, dtype=np.uint8)
+        buf[...] = col[None, :, None]
+        image = Image.fromarray(buf, 'RGB')
 
     elif pattern == "checkerboard":
-        # Create a checkerboard pattern
+        # Checkerboard from index math: one boolean mask pass instead of a
+        # draw.rectangle call per cell
         box_size = 100
-        for i in range(0, width, box_size):
-            for j in range(0, height, box_size):
-                if (i + j) // box_size % 2 == 0:
-                    draw.rectangle([i, j, i + box_size, j + box_size], fill='black')
+        yy, xx = _grid(height, width)
+        mask = ((xx // box_size + yy // box_size) % 2 == 0)
+        buf[...] = np.where(mask[..., None], np.uint8(0), np.uint8(255))
+        image = Image.fromarray(buf, 'RGB')
 
     elif pattern == "circles":
-        # Draw concentric circles
-        max_radius = min(width, height) // 2
-        center = (width // 2, height // 2)
-        for r in range(0, max_radius, 50):
-            draw.ellipse([center[0] - r, center[1] - r,
-                         center[0] + r, center[1] + r],
-                        outline='black', width=2)
+        # Concentric rings thresholded from one radial-distance field
+        # instead of a draw.ellipse call per ring; the distance array is
+        # computed once and reused across all radii
+        yy, xx = _grid(height, width)
+        d = np.sqrt((xx - width // 2) ** 2 + (yy - height // 2) ** 2)
+        mask = np.zeros(d.shape, dtype=bool)
+        for r in range(0, min(width, height) // 2, 50):
+            mask |= np.abs(d - r) < 1.0
+        buf[...] = 255
+        buf[mask] = 0
+        image = Image.fromarray(buf, 'RGB')
 
     elif pattern == "noise":
-        # Create random noise
-        pixels = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
-        image = Image.fromarray(pixels)
+        # The exclusive bound moves from 255 to 256 so the full uint8
+        # range is generated (randint's 255 silently excluded white)
+        buf[...] = _rng.integers(0, 256, size=buf.shape, dtype=np.uint8)
+        image = Image.fromarray(buf)
 
     elif pattern == "lines":
-        # Draw diagonal lines
+        # Diagonal lines as a modulo mask over (x - y) instead of
+        # thousands of draw.line calls
         spacing = 50
-        for i in range(-height, width + height, spacing):
-            draw.line([(i, 0), (i + height, height)], fill='black', width=2)
+        yy, xx = _grid(height, width)
+        mask = ((xx - yy) % spacing) < 2
+        buf[...] = np.where(mask[..., None], np.uint8(0), np.uint8(255))
+        image = Image.fromarray(buf, 'RGB')
+
+    else:
+        image = Image.new('RGB', (width, height), 'white')
 
     return image
\ No newline at end of file
@@ -7,7 +7,9 @@ from image_processor.utils.test_data import generate_test_images
 import os
 import shutil
 import logging
-from PIL import Image, ImageEnhance, ImageFilter
+import numpy as np
+from scipy import ndimage
+from PIL import Image
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
@@ -15,7 +17,18 @@ logger = logging.getLogger(__name__)
 
 class ProfiledImageProcessor(ImageProcessor):
     """Extended image processor with profiled methods."""
-    
+
+    def __init__(self, input_dir, output_dir):
+        super().__init__(input_dir, output_dir)
+        # Scratch buffers reused across frames: fresh float32 working
+        # arrays plus a uint8 output array per image is ~15 MB of
+        # allocator churn at 800x600, and newly mapped pages are
+        # zero-filled by the kernel on first touch while warm pages are
+        # not. Allocated lazily at the first frame's size.
+        self._work = None
+        self._base = None
+        self._out8 = None
+
     @profile
     def _process_single_image(self, filename, resize_dimensions, blur_radius, 
                              sharpen_factor, contrast_factor, brightness_factor):
@@ -26,32 +39,58 @@ class ProfiledImageProcessor(ImageProcessor):
             
             logger.info(f"Processing image: {filename}")
             
-            # Resize
+            # Decode and resize once; the old flow re-encoded and
+            # re-decoded the PNG between every step. For JPEG inputs,
+            # draft lets libjpeg downscale in the DCT domain at decode
+            # time; reducing_gap then box-reduces to ~2x the target
+            # before LANCZOS, cutting sampled source pixels by gap^2.
             image = Image.open(input_path)
-            image = image.resize(resize_dimensions, Image.LANCZOS)
-            image.save(output_path)
-            
-            # Blur
-            image = Image.open(output_path)
-            image = image.filter(ImageFilter.GaussianBlur(blur_radius))
-            image.save(output_path)
-            
-            # Sharpen
-            image = Image.open(output_path)
-            enhancer = ImageEnhance.Sharpness(image)
-            image = enhancer.enhance(sharpen_factor)
-            image.save(output_path)
-            
-            # Contrast
-            image = Image.open(output_path)
-            enhancer = ImageEnhance.Contrast(image)
-            image = enhancer.enhance(contrast_factor)
-            image.save(output_path)
-            
-            # Brightness
-            image = Image.open(output_path)
-            enhancer = ImageEnhance.Brightness(image)
-            image = enhancer.enhance(brightness_factor)
+            if image.format == 'JPEG':
+                image.draft('RGB', resize_dimensions)
+            image = image.resize(resize_dimensions, Image.LANCZOS,
+                                 reducing_gap=2.0)
+
+            # Zero-copy uint8 view of the resized frame (np.array would
+            # copy). From here until the final save the pipeline stays on
+            # ndarrays: no intermediate Image objects, no copy-on-write
+            # duplicates from ImageEnhance, every step writing into the
+            # shared scratch buffers.
+            arr = np.asarray(image)
+            if self._work is None or self._work.shape != arr.shape:
+                self._work = np.empty(arr.shape, dtype=np.float32)
+                self._base = np.empty(arr.shape, dtype=np.float32)
+                self._out8 = np.empty(arr.shape, dtype=np.uint8)
+            work, base = self._work, self._base
+
+            # scipy's separable Gaussian runs one vectorized 1D pass per
+            # spatial axis; sigma=0 on the channel axis keeps RGB planes
+            # independent, output= lands it straight in the scratch buffer
+            ndimage.gaussian_filter(
+                arr, sigma=(blur_radius, blur_radius, 0), output=work)
+
+            # Unsharp mask against a 3x3 box base replaces the
+            # ImageFilter.UnsharpMask stage, avoiding a uint8 round-trip
+            # through Pillow; the detail term reuses the base buffer
+            ndimage.uniform_filter(work, size=(3, 3, 1), output=base)
+            np.subtract(work, base, out=base)
+            base *= sharpen_factor
+            work += base
+
+            # Fused affine contrast (pivot 128) and brightness, in place
+            work -= 128.0
+            work *= contrast_factor
+            work += 128.0
+            work *= brightness_factor
+            np.clip(work, 0, 255, out=work)
+            np.copyto(self._out8, work, casting='unsafe')
+
+            # For mode 'RGB' frombuffer copies the pixels just like
+            # fromarray would (Pillow only shares buffers for 'L'/'RGBX');
+            # it is used here to skip fromarray's per-frame dtype/shape
+            # introspection, not to avoid the copy. Encode once at the end.
+            height, width = self._out8.shape[:2]
+            image = Image.frombuffer('RGB', (width, height), self._out8,
+                                     'raw', 'RGB', 0, 1)
             image.save(output_path)
             
             logger.info(f"Successfully processed: {filename}")
@@ -0,0 +1,117 @@
+"""
+Generate the charts embedded in the optimization report.
+
+The data below is ILLUSTRATIVE PLACEHOLDER DATA, not measured results:
+the arrays sketch the shape of the expected baseline-vs-optimized
+comparison until real numbers are collected with
+image_processor.profiling.benchmark.ImageProcessorBenchmark. Every chart
+title carries the same caveat.
+
+Charts land in reports/images/ and are only rebuilt when this script is
+newer than the existing output, so re-running during report iteration
+skips the matplotlib work entirely.
+"""
+
+import os
+
+# Agg is forced before pyplot is imported so matplotlib skips GUI backend
+# probing (a well-known few-hundred-millisecond startup cost)
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+IMAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'images')
+
+# Illustrative placeholder numbers (see module docstring) — replace with
+# ImageProcessorBenchmark measurements before publishing the report
+IMAGE_COUNTS = [5, 10, 25, 50]
+BASELINE_TIMES = [4.8, 9.5, 23.9, 47.6]
+OPTIMIZED_TIMES = [1.3, 2.1, 4.4, 8.2]
+BASELINE_PEAK_MB = [212, 218, 224, 231]
+OPTIMIZED_PEAK_MB = [96, 101, 103, 108]
+PIPELINE_STAGES = ['decode', 'resize', 'blur', 'enhance', 'encode']
+BASELINE_STAGE_TIMES = [0.14, 0.31, 0.22, 0.19, 0.11]
+OPTIMIZED_STAGE_TIMES = [0.06, 0.09, 0.08, 0.04, 0.05]
+
+def _is_stale(path: str) -> bool:
+    """True when the chart is missing or older than this script."""
+    return (not os.path.exists(path)
+            or os.path.getmtime(__file__) > os.path.getmtime(path))
+
+def generate_time_chart(fig, ax, path: str):
+    """Total processing time, baseline vs optimized, by image count."""
+    ax.clear()
+    ax.plot(IMAGE_COUNTS, BASELINE_TIMES, marker='o', label='Baseline')
+    ax.plot(IMAGE_COUNTS, OPTIMIZED_TIMES, marker='o', label='Optimized')
+    ax.set_xlabel('Number of images')
+    ax.set_ylabel('Total time (s)')
+    ax.set_title('Processing time comparison (illustrative data)')
+    ax.legend()
+    fig.savefig(path, dpi=300)
+
+def generate_memory_chart(fig, ax, path: str):
+    """Peak RSS, baseline vs optimized, by image count."""
+    ax.clear()
+    ax.plot(IMAGE_COUNTS, BASELINE_PEAK_MB, marker='o', label='Baseline')
+    ax.plot(IMAGE_COUNTS, OPTIMIZED_PEAK_MB, marker='o', label='Optimized')
+    ax.set_xlabel('Number of images')
+    ax.set_ylabel('Peak memory (MB)')
+    ax.set_title('Peak memory comparison (illustrative data)')
+    ax.legend()
+    fig.savefig(path, dpi=300)
+
+def generate_speedup_chart(fig, ax, path: str):
+    """Speedup factor of the optimized pipeline by image count."""
+    ax.clear()
+    speedups = [b / o for b, o in zip(BASELINE_TIMES, OPTIMIZED_TIMES)]
+    ax.bar([str(n) for n in IMAGE_COUNTS], speedups)
+    ax.set_xlabel('Number of images')
+    ax.set_ylabel('Speedup (x)')
+    ax.set_title('Optimized pipeline speedup (illustrative data)')
+    fig.savefig(path, dpi=300)
+
+def generate_stage_chart(fig, ax, path: str):
+    """Per-stage time for one image, baseline vs optimized."""
+    ax.clear()
+    x = range(len(PIPELINE_STAGES))
+    width = 0.4
+    ax.bar([i - width / 2 for i in x], BASELINE_STAGE_TIMES, width,
+           label='Baseline')
+    ax.bar([i + width / 2 for i in x], OPTIMIZED_STAGE_TIMES, width,
+           label='Optimized')
+    ax.set_xticks(list(x))
+    ax.set_xticklabels(PIPELINE_STAGES)
+    ax.set_ylabel('Time per image (s)')
+    ax.set_title('Per-stage time breakdown (illustrative data)')
+    ax.legend()
+    fig.savefig(path, dpi=300)
+
+CHARTS = [
+    ('time_comparison.png', generate_time_chart),
+    ('memory_comparison.png', generate_memory_chart),
+    ('speedup.png', generate_speedup_chart),
+    ('stage_breakdown.png', generate_stage_chart),
+]
+
+def main():
+    os.makedirs(IMAGES_DIR, exist_ok=True)
+    stale = [(os.path.join(IMAGES_DIR, filename), generate)
+             for filename, generate in CHARTS
+             if _is_stale(os.path.join(IMAGES_DIR, filename))]
+    if not stale:
+        print("All charts up to date")
+        return
+
+    # One figure/axes pair shared by every chart: each plt.subplots call
+    # re-creates roughly a megabyte of figure and backend state, so the
+    # chart functions clear the axes instead
+    fig, ax = plt.subplots(figsize=(10, 6))
+    try:
+        for path, generate in stale:
+            generate(fig, ax, path)
+            print(f"Generated {path}")
+    finally:
+        plt.close(fig)
+
+if __name__ == "__main__":
+    main()
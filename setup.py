@@ -2,18 +2,43 @@
 Setup script for the image processor package.
 """
 
+import importlib.util
+import os
+
 from setuptools import setup, find_packages
 
+# AOT-compile the numba pattern kernels into a prebuilt extension when
+# numba and a C toolchain are available at build time; installs without
+# them still work, falling back to the JIT or NumPy kernels at runtime
+# (see image_processor/utils/test_data.py). The module is loaded by file
+# path so the package itself is not imported during the build.
+try:
+    import numba.pycc  # noqa: F401
+    _aot_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "image_processor", "utils", "_patterns_aot.py")
+    _spec = importlib.util.spec_from_file_location("_patterns_aot", _aot_path)
+    _patterns_aot = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_patterns_aot)
+    _ext = _patterns_aot.cc.distutils_extension()
+    # Dotted name so build_ext drops the .so inside the package rather
+    # than at the distribution root
+    _ext.name = "image_processor.utils._patterns_native"
+    ext_modules = [_ext]
+except ImportError:
+    ext_modules = []
+
 setup(
     name="image-processor",
     version="0.1.0",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "Pillow>=9.0.0",
         "matplotlib>=3.5.0",
         "memory_profiler>=0.60.0",
         "psutil>=5.9.0",
         "numpy>=1.20.0",
+        "scipy>=1.8.0",
     ],
     entry_points={
         "console_scripts": [